@@ -1,10 +1,37 @@
 #!/usr/bin/env python3
+import asyncio
 import requests
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson opsional, fallback ke json bawaan
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# httpx hanya dibutuhkan untuk bulk deployment
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 
 # Konfigurasi
 DEFAULT_GITHUB_URL = (
@@ -13,38 +40,231 @@ DEFAULT_GITHUB_URL = (
 API_URL = "https://api.cflifetime.workers.dev/"
 ACCOUNTS_FILE = Path.cwd() / "accounts.json"
 GITHUB_URLS_FILE = Path.cwd() / "github_urls.json"
+BULK_CONCURRENCY = 16  # Maksimal deployment paralel saat bulk
+BATCH_TIMEOUT = 300  # Timeout satu request batch deployment (detik)
+HTTP2_AVAILABLE = find_spec("h2") is not None  # HTTP/2 butuh httpx[http2]
+PROGRESS_FLUSH_EVERY = 10  # Flush output progress tiap N deployment
+
+# Tampilan
+SEP = "━" * 53
+DASH = "─" * 53
+_COLOR_FMT = {c: f"\033[{c}m{{}}\033[0m" for c in ("91", "92", "93", "94", "96")}
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+_IS_TTY = sys.stdout.isatty()  # Output di-pipe: tanpa ANSI & centering
+
+# Validasi email akun
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Ekstrak UUID / password dari URL config
+_VLESS_RE = re.compile(r"^vless://([^@]+)@")
+_TROJAN_RE = re.compile(r"^trojan://([^@]+)@")
+
+
+def enable_windows_ansi():
+    """Aktifkan ANSI escape di console Windows 10+"""
+    if os.name != "nt":
+        return
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(
+                handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            )
+    except Exception:
+        pass
 
 
 class CFWorkerCLI:
     def __init__(self):
-        self.accounts = self.load_accounts()
-        self.github_urls = self.load_github_urls()
+        # Baca file config di background, baru ditunggu saat pertama dipakai.
+        # Parse, print error & pembuatan file default tetap di main thread.
+        executor = ThreadPoolExecutor(max_workers=2)
+        self._accounts_future = executor.submit(self._read_config_file, ACCOUNTS_FILE)
+        self._urls_future = executor.submit(self._read_config_file, GITHUB_URLS_FILE)
+        executor.shutdown(wait=False)
+        self._name_index: Dict[str, int] = {}
+        self._default_idx = 0
+
+        self.session = self.create_session()
+        self._batch_supported: Optional[bool] = None
+
+        # Tabel dispatch menu: pilihan -> aksi
+        self._main_actions = {
+            1: self.single_deploy,
+            2: self.bulk_deploy,
+            3: self.manage_accounts_menu,
+            4: self.manage_github_urls_menu,
+            5: self.show_status,
+        }
+        self._account_actions = {
+            1: self.list_accounts,
+            2: self.add_account,
+            3: self.remove_account,
+        }
+        self._github_url_actions = {
+            1: self.list_github_urls,
+            2: self.add_github_url,
+            3: self.remove_github_url,
+            4: self.set_default_github_url_menu,
+        }
+
+    def create_session(self) -> requests.Session:
+        """Buat HTTP session dengan connection pool & retry"""
+        session = requests.Session()
+        # POST (deploy) tidak termasuk allowed_methods default urllib3, jadi hanya
+        # di-retry jika gagal connect; deploy di server mungkin masih berjalan
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+        session.mount("https://", adapter)
+        return session
 
     def clear_screen(self):
-        """Clear screen berdasarkan OS"""
-        os.system("cls" if os.name == "nt" else "clear")
+        """Clear screen pakai ANSI escape (tanpa subprocess)"""
+        if _IS_TTY:
+            sys.stdout.write("\033[2J\033[H")
+            sys.stdout.flush()
 
     def wait_enter(self):
         """Tunggu tekan enter"""
         input("\n⏎ Press Enter to continue...")
 
-    def load_accounts(self) -> List[Dict]:
-        """Load accounts dari file"""
+    def _read_int(
+        self, prompt: str, lo: int, hi: int, default: Optional[int] = None
+    ) -> Optional[int]:
+        """Baca angka dari input, None jika bukan angka atau di luar range"""
+        value = input(prompt).strip()
+        if not value:
+            return default
+        if not value.isdecimal():
+            return None
+        number = int(value)
+        return number if lo <= number <= hi else None
+
+    def _invalid_choice(self, message="Invalid choice"):
+        """Tampilkan error pilihan menu tidak valid"""
+        self.show_error(message)
+        self.wait_enter()
+
+    def _file_mtime(self, path: Path) -> Optional[int]:
+        """Dapatkan mtime file (ns), None jika tidak ada"""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _load_if_changed(self, path: Path, cache_attr: str, mtime_attr: str, loader):
+        """Load file hanya jika mtime berubah sejak load terakhir"""
+        mtime = self._file_mtime(path)
+        if hasattr(self, cache_attr) and mtime == getattr(self, mtime_attr, None):
+            return getattr(self, cache_attr)
+
+        data = loader()
+        self._record_mtime(path, mtime_attr, mtime)
+        return data
+
+    def _record_mtime(self, path: Path, mtime_attr: str, mtime: Optional[int]):
+        """Simpan mtime dari sebelum load, agar edit saat load tetap terdeteksi"""
+        # Jika file baru dibuat oleh loader, save_* sudah mencatat mtime-nya
+        if mtime is not None or self._file_mtime(path) is None:
+            setattr(self, mtime_attr, mtime)
+
+    def _read_config_file(self, path: Path) -> Tuple[Optional[int], Optional[bytes]]:
+        """Baca mtime & isi file mentah, (None, None) jika tidak ada"""
+        mtime = self._file_mtime(path)
+        if mtime is None:
+            return None, None
+        return mtime, path.read_bytes()
+
+    def _finish_initial_load(self, future, path: Path, mtime_attr: str, loader):
+        """Parse hasil baca file dari background di main thread"""
+        try:
+            mtime, raw = future.result()
+        except OSError:
+            # Biarkan loader membaca ulang dan menampilkan error-nya
+            mtime, raw = self._file_mtime(path), None
+
+        data = loader(raw)
+        self._record_mtime(path, mtime_attr, mtime)
+        return data
+
+    def _resolve_github_urls(self):
+        """Tunggu load awal GitHub URLs jika masih berjalan di background"""
+        if self._urls_future is not None:
+            self.github_urls = self._finish_initial_load(
+                self._urls_future,
+                GITHUB_URLS_FILE,
+                "_urls_mtime",
+                self.load_github_urls,
+            )
+
+    @property
+    def accounts(self) -> List[Dict]:
+        if self._accounts_future is not None:
+            self.accounts = self._finish_initial_load(
+                self._accounts_future,
+                ACCOUNTS_FILE,
+                "_accounts_mtime",
+                self.load_accounts,
+            )
+        return self._accounts
+
+    @accounts.setter
+    def accounts(self, value: List[Dict]):
+        self._accounts_future = None
+        self._accounts = value
+
+    @property
+    def github_urls(self) -> List[Dict]:
+        self._resolve_github_urls()
+        return self._github_urls
+
+    @github_urls.setter
+    def github_urls(self, value: List[Dict]):
+        self._urls_future = None
+        self._github_urls = value
+        self._rebuild_indexes()
+
+    def refresh_config(self):
+        """Muat ulang accounts & GitHub URLs jika file berubah"""
+        # Selama load awal belum dipakai, datanya pasti masih terbaru
+        if self._accounts_future is None:
+            self.accounts = self._load_if_changed(
+                ACCOUNTS_FILE, "_accounts", "_accounts_mtime", self.load_accounts
+            )
+        if self._urls_future is None:
+            github_urls = self._load_if_changed(
+                GITHUB_URLS_FILE, "_github_urls", "_urls_mtime", self.load_github_urls
+            )
+            if github_urls is not self._github_urls:
+                self.github_urls = github_urls
+
+    def load_accounts(self, raw: Optional[bytes] = None) -> List[Dict]:
+        """Load accounts dari file (atau dari isi file yang sudah dibaca)"""
         try:
-            if ACCOUNTS_FILE.exists():
-                with open(ACCOUNTS_FILE, "r") as f:
-                    return json.load(f)
+            if raw is None and ACCOUNTS_FILE.exists():
+                raw = ACCOUNTS_FILE.read_bytes()
+            if raw is not None:
+                return _loads(raw)
         except Exception as e:
             print(f"Error loading accounts: {e}")
         return []
 
-    def load_github_urls(self) -> List[Dict]:
-        """Load GitHub URLs dari file"""
+    def load_github_urls(self, raw: Optional[bytes] = None) -> List[Dict]:
+        """Load GitHub URLs dari file (atau dari isi file yang sudah dibaca)"""
         try:
-            if GITHUB_URLS_FILE.exists():
-                with open(GITHUB_URLS_FILE, "r") as f:
-                    data = json.load(f)
-                    return data
+            if raw is None and GITHUB_URLS_FILE.exists():
+                raw = GITHUB_URLS_FILE.read_bytes()
+            if raw is not None:
+                return _loads(raw)
             else:
                 # Buat file default jika tidak ada
                 default_urls = [
@@ -60,11 +280,32 @@ class CFWorkerCLI:
             print(f"Error loading GitHub URLs: {e}")
             return []
 
+    def _write_json_atomic(self, path: Path, obj):
+        """Tulis JSON ke file temp lalu replace, agar file tidak korup"""
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        # Pertahankan permission file lama (accounts.json berisi API key)
+        try:
+            mode = path.stat().st_mode & 0o777
+        except OSError:
+            mode = 0o600
+
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(obj))
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp, mode)  # Mode dari os.open masih kena umask
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
     def save_accounts(self):
         """Simpan accounts ke file"""
         try:
-            with open(ACCOUNTS_FILE, "w") as f:
-                json.dump(self.accounts, f, indent=2)
+            self._write_json_atomic(ACCOUNTS_FILE, self.accounts)
+            self._accounts_mtime = self._file_mtime(ACCOUNTS_FILE)
         except Exception as e:
             print(f"Error saving accounts: {e}")
 
@@ -73,31 +314,45 @@ class CFWorkerCLI:
         try:
             if urls is None:
                 urls = self.github_urls
-            with open(GITHUB_URLS_FILE, "w") as f:
-                json.dump(urls, f, indent=2)
+            self._write_json_atomic(GITHUB_URLS_FILE, urls)
+            self._urls_mtime = self._file_mtime(GITHUB_URLS_FILE)
         except Exception as e:
             print(f"Error saving GitHub URLs: {e}")
 
+    def _rebuild_indexes(self):
+        """Bangun ulang index nama & default GitHub URL"""
+        self._name_index = {
+            item["name"].casefold(): i for i, item in enumerate(self.github_urls)
+        }
+        # Fallback ke pertama jika tidak ada yang default
+        self._default_idx = next(
+            (
+                i
+                for i, item in enumerate(self.github_urls)
+                if item.get("is_default", False)
+            ),
+            0,
+        )
+
     def get_default_github_url(self) -> str:
         """Dapatkan default GitHub URL"""
-        for item in self.github_urls:
-            if item.get("is_default", False):
-                return item["url"]
-        # Fallback ke pertama atau default
         if self.github_urls:
-            return self.github_urls[0]["url"]
+            return self.github_urls[self._default_idx]["url"]
         return DEFAULT_GITHUB_URL
 
     def set_default_github_url(self, url: str):
         """Set default GitHub URL"""
         for item in self.github_urls:
             item["is_default"] = item["url"] == url
+        self._rebuild_indexes()
         self.save_github_urls()
 
     def print_colored(self, text, color_code):
         """Print text dengan warna"""
-        text = text.center(53)
-        print(f"\033[{color_code}m{text}\033[0m")
+        if _IS_TTY:
+            sys.stdout.write(_COLOR_FMT[color_code].format(text.center(53)) + "\n")
+        else:
+            sys.stdout.write(text + "\n")
 
     def show_success(self, message):
         self.print_colored(f"✅ {message}", "92")  # Green
@@ -116,13 +371,20 @@ class CFWorkerCLI:
     ):
         """Tampilkan header aplikasi"""
         self.clear_screen()
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print("\n" + SEP)
         self.print_colored(f"🚀 {title}", "96")
         if subtitle:
             self.print_colored(f"{subtitle}", "93")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(SEP)
         print()
 
+    def _read_deploy_response(self, response: requests.Response) -> Dict:
+        """Parse response deploy secara streaming"""
+        buf = bytearray()
+        for chunk in iter(lambda: response.raw.read(65536, decode_content=True), b""):
+            buf += chunk
+        return _loads(buf)
+
     def deploy_worker(self, account: Dict, worker_name: str, github_url: str) -> Dict:
         """Deploy worker ke Cloudflare"""
         try:
@@ -136,82 +398,226 @@ class CFWorkerCLI:
                 "githubUrl": github_url,
             }
 
-            response = requests.post(API_URL, json=request_data, timeout=30)
+            with self.session.post(
+                API_URL, json=request_data, timeout=30, stream=True
+            ) as response:
+                if response.status_code == 200:
+                    result_data = self._read_deploy_response(response)
+
+                    if result_data.get("success"):
+                        self.show_success("Worker deployed successfully!")
+                        return {"success": True, "data": result_data}
+                    else:
+                        error_msg = result_data.get("error", "Unknown error")
+                        raise Exception(f"Deployment failed: {error_msg}")
+                else:
+                    # Cukup ambil 1KB pertama untuk pesan error
+                    error_body = response.raw.read(1024, decode_content=True)
+                    raise Exception(
+                        f"HTTP {response.status_code}: "
+                        f"{error_body.decode('utf-8', 'replace')}"
+                    )
 
-            if response.status_code == 200:
-                result_data = response.json()
+        except Exception as e:
+            self.show_error(f"Deployment failed: {str(e)}")
+            return {"success": False, "error": str(e)}
 
-                if result_data.get("success"):
-                    self.show_success("Worker deployed successfully!")
-                    return {"success": True, "data": result_data}
+    def _request_prefix(self, account: Dict, github_url: str) -> bytes:
+        """JSON request satu akun, tanpa '}' penutup (workerName disambung nanti)"""
+        return _dumps(
+            {
+                "email": account["email"],
+                "globalAPIKey": account["global_api_key"],
+                "githubUrl": github_url,
+            }
+        )[:-1]
+
+    async def _deploy_worker_async(
+        self,
+        client: "httpx.AsyncClient",
+        request_prefix: bytes,
+        worker_name: str,
+    ) -> Dict:
+        """Deploy worker ke Cloudflare (async, dipakai bulk deployment)"""
+        try:
+            body = request_prefix + b',"workerName":' + _dumps(worker_name) + b"}"
+
+            async with client.stream(
+                "POST",
+                API_URL,
+                content=body,
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                if response.status_code == 200:
+                    result_data = _loads(await response.aread())
+
+                    if result_data.get("success"):
+                        return {"success": True, "data": result_data}
+                    else:
+                        error_msg = result_data.get("error", "Unknown error")
+                        raise Exception(f"Deployment failed: {error_msg}")
                 else:
-                    error_msg = result_data.get("error", "Unknown error")
-                    raise Exception(f"Deployment failed: {error_msg}")
-            else:
-                raise Exception(f"HTTP {response.status_code}: {response.text}")
+                    error_body = b""
+                    async for chunk in response.aiter_bytes():
+                        error_body += chunk
+                        if len(error_body) >= 1024:
+                            break
+                    raise Exception(
+                        f"HTTP {response.status_code}: "
+                        f"{error_body[:1024].decode('utf-8', 'replace')}"
+                    )
 
         except Exception as e:
-            self.show_error(f"Deployment failed: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    def supports_batch_deploy(self) -> bool:
+        """Cek (sekali per sesi) apakah API mendukung batch deployment"""
+        if self._batch_supported is None:
+            try:
+                response = self.session.options(API_URL, timeout=10)
+                self._batch_supported = response.headers.get("X-Batch-Supported") == "1"
+            except Exception:
+                self._batch_supported = False
+        return self._batch_supported
+
+    def _batch_deploy(self, worker_names: List[str], github_url: str) -> List[Dict]:
+        """Kirim semua deployment dalam satu request batch"""
+        tasks = [
+            (account, worker_name)
+            for account in self.accounts
+            for worker_name in worker_names
+        ]
+        bulk_payload = {
+            "deployments": [
+                {
+                    "email": account["email"],
+                    "globalAPIKey": account["global_api_key"],
+                    "workerName": worker_name,
+                    "githubUrl": github_url,
+                }
+                for account, worker_name in tasks
+            ]
+        }
+
+        response = self.session.post(API_URL, json=bulk_payload, timeout=BATCH_TIMEOUT)
+        if response.status_code != 200:
+            raise Exception(f"HTTP {response.status_code}")
+
+        items = _loads(response.content).get("results", [])
+        if len(items) != len(tasks):
+            raise Exception("Unexpected batch response")
+
+        # Hasil batch berurutan sesuai deployments yang dikirim
+        results = []
+        for (account, worker_name), item in zip(tasks, items):
+            result = {"account": account["email"], "worker": worker_name}
+            if item.get("success"):
+                result.update({"success": True, "data": item})
+            else:
+                error_msg = item.get("error", "Unknown error")
+                result.update(
+                    {"success": False, "error": f"Deployment failed: {error_msg}"}
+                )
+            results.append(result)
+        return results
+
+    async def _bulk_deploy_async(
+        self, worker_names: List[str], github_url: str
+    ) -> List[Dict]:
+        """Jalankan semua deployment secara paralel"""
+        # Bagian request yang sama per akun cukup di-encode sekali
+        tasks = []
+        for account in self.accounts:
+            request_prefix = self._request_prefix(account, github_url)
+            tasks.extend(
+                (account, request_prefix, worker_name) for worker_name in worker_names
+            )
+        total_deployments = len(tasks)
+        sem = asyncio.Semaphore(BULK_CONCURRENCY)
+        progress: asyncio.Queue = asyncio.Queue()
+
+        async def run(client, account, request_prefix, worker_name):
+            result = {"account": account["email"], "worker": worker_name}
+            async with sem:
+                result.update(
+                    await self._deploy_worker_async(client, request_prefix, worker_name)
+                )
+            await progress.put(result)
+            return result
+
+        async def printer():
+            # Satu coroutine yang menulis progress, flush tiap beberapa hasil
+            for current in range(1, total_deployments + 1):
+                result = await progress.get()
+                status = "✅ Success" if result["success"] else "❌ Failed"
+                sys.stdout.write(
+                    f"\n🔄 [{current}/{total_deployments}] "
+                    f"{result['worker']} on {result['account']}\n{status}\n"
+                )
+                if current % PROGRESS_FLUSH_EVERY == 0:
+                    sys.stdout.flush()
+            sys.stdout.flush()
+
+        printer_task = asyncio.create_task(printer())
+        # HTTP/2: semua request di-multiplex lewat satu koneksi TLS
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=30.0,
+        ) as client:
+            results = await asyncio.gather(*(run(client, *task) for task in tasks))
+        await printer_task
+        return results
+
     def display_result(self, result_data: Dict):
         """Tampilkan hasil deployment"""
         self.clear_screen()
         self.show_header("DEPLOYMENT RESULT", "Worker Successfully Deployed")
 
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(SEP)
         self.print_colored("🎉 DEPLOYMENT SUCCESSFUL", "92")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(SEP)
+
+        # Hanya nilai string yang ditampilkan; tipe lain dari API diabaikan
+        sub = result_data.get("sub")
+        vless = result_data.get("vless")
+        trojan = result_data.get("trojan")
 
         # Subscription Link
-        if "sub" in result_data and result_data["sub"]:
+        if isinstance(sub, str) and sub:
             print("\n📋 SUBSCRIPTION LINK")
-            print("🔗 " + result_data["sub"])
+            print("🔗 " + sub)
 
         # VLESS
-        if "vless" in result_data and result_data["vless"]:
+        if isinstance(vless, str) and vless:
             print("\n🔰 VLESS CONFIG")
-            print("🔗 " + result_data["vless"])
+            print("🔗 " + vless)
 
             # Extract UUID untuk info
-            try:
-                vless_url = result_data["vless"]
-                if "vless://" in vless_url:
-                    uuid_start = vless_url.find("vless://") + 8
-                    uuid_end = vless_url.find("@", uuid_start)
-                    if uuid_end != -1:
-                        uuid = vless_url[uuid_start:uuid_end]
-                        print(f"🔑 UUID: {uuid}")
-            except:
-                pass
+            match = _VLESS_RE.match(vless)
+            if match:
+                print(f"🔑 UUID: {match.group(1)}")
 
         # Trojan
-        if "trojan" in result_data and result_data["trojan"]:
+        if isinstance(trojan, str) and trojan:
             print("\n⚡ TROJAN CONFIG")
-            print("🔗 " + result_data["trojan"])
+            print("🔗 " + trojan)
 
             # Extract Password untuk info
-            try:
-                trojan_url = result_data["trojan"]
-                if "trojan://" in trojan_url:
-                    pwd_start = trojan_url.find("trojan://") + 9
-                    pwd_end = trojan_url.find("@", pwd_start)
-                    if pwd_end != -1:
-                        password = trojan_url[pwd_start:pwd_end]
-                        print(f"🔑 Password: {password}")
-            except:
-                pass
-
-        print("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            match = _TROJAN_RE.match(trojan)
+            if match:
+                print(f"🔑 Password: {match.group(1)}")
+
+        print("\n" + SEP)
         self.print_colored("💡 Copy URLs above and use in your client apps", "93")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(SEP)
 
     def add_account(self):
         """Tambah akun baru"""
         self.show_header("ADD NEW ACCOUNT", "Add Cloudflare Account Credentials")
 
         email = input("📧 Cloudflare Email: ").strip()
-        if not email or "@" not in email:
+        if not _EMAIL_RE.match(email):
             self.show_error("Please enter a valid email")
             self.wait_enter()
             return
@@ -237,7 +643,7 @@ class CFWorkerCLI:
             return
 
         print("No.  Email".ljust(40) + "API Key")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
         for i, account in enumerate(self.accounts, 1):
             api_key_preview = (
                 account["global_api_key"][:8] + "..." + account["global_api_key"][-4:]
@@ -256,24 +662,25 @@ class CFWorkerCLI:
             return
 
         print("Select account to remove:")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
         for i, account in enumerate(self.accounts, 1):
             print(f"{i}. {account['email']}")
         print(f"{len(self.accounts) + 1}. Cancel")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
 
-        try:
-            choice = int(input("\nSelect account to remove: "))
-            if 1 <= choice <= len(self.accounts):
-                removed_account = self.accounts.pop(choice - 1)
-                self.save_accounts()
-                self.show_success(
-                    f"Account {removed_account['email']} removed successfully!"
-                )
-            else:
-                self.show_info("Cancelled")
-        except:
+        choice = self._read_int(
+            "\nSelect account to remove: ", 1, len(self.accounts) + 1
+        )
+        if choice is None:
             self.show_error("Invalid choice")
+        elif choice <= len(self.accounts):
+            removed_account = self.accounts.pop(choice - 1)
+            self.save_accounts()
+            self.show_success(
+                f"Account {removed_account['email']} removed successfully!"
+            )
+        else:
+            self.show_info("Cancelled")
 
         self.wait_enter()
 
@@ -294,15 +701,16 @@ class CFWorkerCLI:
             return
 
         # Cek apakah nama sudah ada
-        for item in self.github_urls:
-            if item["name"].lower() == name.lower():
-                self.show_error(f"Script name '{name}' already exists")
-                self.wait_enter()
-                return
+        self._resolve_github_urls()
+        if name.casefold() in self._name_index:
+            self.show_error(f"Script name '{name}' already exists")
+            self.wait_enter()
+            return
 
         new_item = {"name": name, "url": url, "is_default": False}
 
         self.github_urls.append(new_item)
+        self._rebuild_indexes()
         self.save_github_urls()
         self.show_success(f"GitHub URL '{name}' added successfully!")
 
@@ -329,7 +737,7 @@ class CFWorkerCLI:
             return
 
         print("No.  Name".ljust(30) + "URL")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
         for i, item in enumerate(self.github_urls, 1):
             default_indicator = " ← DEFAULT" if item.get("is_default", False) else ""
             print(f"{i:2}.  {item['name']}".ljust(30) + item["url"] + default_indicator)
@@ -346,30 +754,32 @@ class CFWorkerCLI:
             return
 
         print("Select GitHub URL to remove:")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
         for i, item in enumerate(self.github_urls, 1):
             default_indicator = " (default)" if item.get("is_default", False) else ""
             print(f"{i}. {item['name']}{default_indicator}")
         print(f"{len(self.github_urls) + 1}. Cancel")
-        print("─────────────────────────────────────────────────────")
-
-        try:
-            choice = int(input("\nSelect URL to remove: "))
-            if 1 <= choice <= len(self.github_urls):
-                removed_item = self.github_urls.pop(choice - 1)
-                self.save_github_urls()
-                self.show_success(
-                    f"GitHub URL '{removed_item['name']}' removed successfully!"
-                )
+        print(DASH)
 
-                # Jika yang dihapus adalah default, set ulang default
-                if removed_item.get("is_default", False) and self.github_urls:
-                    self.set_default_github_url(self.github_urls[0]["url"])
-                    self.show_info(f"Default URL set to: {self.github_urls[0]['name']}")
-            else:
-                self.show_info("Cancelled")
-        except:
+        choice = self._read_int(
+            "\nSelect URL to remove: ", 1, len(self.github_urls) + 1
+        )
+        if choice is None:
             self.show_error("Invalid choice")
+        elif choice <= len(self.github_urls):
+            removed_item = self.github_urls.pop(choice - 1)
+            self._rebuild_indexes()
+            self.save_github_urls()
+            self.show_success(
+                f"GitHub URL '{removed_item['name']}' removed successfully!"
+            )
+
+            # Jika yang dihapus adalah default, set ulang default
+            if removed_item.get("is_default", False) and self.github_urls:
+                self.set_default_github_url(self.github_urls[0]["url"])
+                self.show_info(f"Default URL set to: {self.github_urls[0]['name']}")
+        else:
+            self.show_info("Cancelled")
 
         self.wait_enter()
 
@@ -383,27 +793,26 @@ class CFWorkerCLI:
             return
 
         print("Select default GitHub URL:")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
         for i, item in enumerate(self.github_urls, 1):
             current_indicator = (
                 " ← CURRENT DEFAULT" if item.get("is_default", False) else ""
             )
             print(f"{i}. {item['name']}{current_indicator}")
         print(f"{len(self.github_urls) + 1}. Cancel")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
 
-        try:
-            choice = int(input("\nSelect default URL: "))
-            if 1 <= choice <= len(self.github_urls):
-                selected_url = self.github_urls[choice - 1]["url"]
-                self.set_default_github_url(selected_url)
-                self.show_success(
-                    f"Default GitHub URL set to: {self.github_urls[choice - 1]['name']}"
-                )
-            else:
-                self.show_info("Cancelled")
-        except:
+        choice = self._read_int("\nSelect default URL: ", 1, len(self.github_urls) + 1)
+        if choice is None:
             self.show_error("Invalid choice")
+        elif choice <= len(self.github_urls):
+            selected_url = self.github_urls[choice - 1]["url"]
+            self.set_default_github_url(selected_url)
+            self.show_success(
+                f"Default GitHub URL set to: {self.github_urls[choice - 1]['name']}"
+            )
+        else:
+            self.show_info("Cancelled")
 
         self.wait_enter()
 
@@ -413,28 +822,23 @@ class CFWorkerCLI:
             return self.get_default_github_url()
 
         print("\n📦 Select GitHub URL:")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
         for i, item in enumerate(self.github_urls, 1):
             default_indicator = " (default)" if item.get("is_default", False) else ""
             print(f"{i}. {item['name']}{default_indicator}")
-        print("─────────────────────────────────────────────────────")
-
-        try:
-            choice = input(
-                f"\nSelect URL [1-{len(self.github_urls)} or Enter for default]: "
-            ).strip()
-            if not choice:
-                return self.get_default_github_url()
-
-            choice = int(choice)
-            if 1 <= choice <= len(self.github_urls):
-                return self.github_urls[choice - 1]["url"]
-            else:
-                self.show_error("Invalid choice, using default")
-                return self.get_default_github_url()
-        except:
-            self.show_error("Invalid input, using default")
+        print(DASH)
+
+        # Enter kosong = URL default
+        choice = self._read_int(
+            f"\nSelect URL [1-{len(self.github_urls)} or Enter for default]: ",
+            1,
+            len(self.github_urls),
+            default=self._default_idx + 1,
+        )
+        if choice is None:
+            self.show_error("Invalid choice, using default")
             return self.get_default_github_url()
+        return self.github_urls[choice - 1]["url"]
 
     def manage_accounts_menu(self):
         """Menu manajemen akun"""
@@ -447,23 +851,15 @@ class CFWorkerCLI:
             print("4. 🔙 Back to Main Menu")
             print()
 
-            try:
-                choice = int(input("Select action: "))
-
-                if choice == 1:
-                    self.list_accounts()
-                elif choice == 2:
-                    self.add_account()
-                elif choice == 3:
-                    self.remove_account()
-                elif choice == 4:
-                    break
-                else:
-                    self.show_error("Invalid choice")
-                    self.wait_enter()
-            except:
-                self.show_error("Invalid input")
-                self.wait_enter()
+            choice = self._read_int("Select action: ", 1, 4)
+            if choice == 4:
+                break
+
+            action = self._account_actions.get(choice)
+            if action:
+                action()
+            else:
+                self._invalid_choice()
 
     def manage_github_urls_menu(self):
         """Menu manajemen GitHub URLs"""
@@ -477,25 +873,15 @@ class CFWorkerCLI:
             print("5. 🔙 Back to Main Menu")
             print()
 
-            try:
-                choice = int(input("Select action: "))
-
-                if choice == 1:
-                    self.list_github_urls()
-                elif choice == 2:
-                    self.add_github_url()
-                elif choice == 3:
-                    self.remove_github_url()
-                elif choice == 4:
-                    self.set_default_github_url_menu()
-                elif choice == 5:
-                    break
-                else:
-                    self.show_error("Invalid choice")
-                    self.wait_enter()
-            except:
-                self.show_error("Invalid input")
-                self.wait_enter()
+            choice = self._read_int("Select action: ", 1, 5)
+            if choice == 5:
+                break
+
+            action = self._github_url_actions.get(choice)
+            if action:
+                action()
+            else:
+                self._invalid_choice()
 
     def single_deploy(self):
         """Deploy single worker"""
@@ -510,54 +896,55 @@ class CFWorkerCLI:
 
         # Pilih akun
         print("Select account:")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
         for i, account in enumerate(self.accounts, 1):
             print(f"{i}. {account['email']}")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
 
-        try:
-            choice = int(input("\nSelect account: "))
-            if not 1 <= choice <= len(self.accounts):
-                self.show_error("Invalid choice")
-                self.wait_enter()
-                return
+        choice = self._read_int("\nSelect account: ", 1, len(self.accounts))
+        if choice is None:
+            self.show_error("Invalid choice")
+            self.wait_enter()
+            return
 
-            account = self.accounts[choice - 1]
+        account = self.accounts[choice - 1]
 
-            # Input worker details
-            worker_name = input("\n🔧 Worker name: ").strip()
-            if not worker_name:
-                self.show_error("Worker name is required")
-                self.wait_enter()
-                return
-
-            # Pilih GitHub URL
-            github_url = self.select_github_url()
+        # Input worker details
+        worker_name = input("\n🔧 Worker name: ").strip()
+        if not worker_name:
+            self.show_error("Worker name is required")
+            self.wait_enter()
+            return
 
-            # Konfirmasi deployment
-            self.show_header("DEPLOYMENT CONFIRMATION", "Review Deployment Details")
+        # Pilih GitHub URL
+        github_url = self.select_github_url()
 
-            print("📊 DEPLOYMENT SUMMARY")
-            print("─────────────────────────────────────────────────────")
-            print(f"📧 Account: {account['email']}")
-            print(f"🔧 Worker: {worker_name}")
-            print(f"📦 GitHub URL: {github_url}")
-            print("─────────────────────────────────────────────────────")
+        # Konfirmasi deployment
+        self.show_header("DEPLOYMENT CONFIRMATION", "Review Deployment Details")
 
-            if input("\nProceed with deployment? (y/n): ").lower() == "y":
-                result = self.deploy_worker(account, worker_name, github_url)
-                if result["success"]:
-                    self.display_result(result["data"])
-                self.wait_enter()
+        print("📊 DEPLOYMENT SUMMARY")
+        print(DASH)
+        print(f"📧 Account: {account['email']}")
+        print(f"🔧 Worker: {worker_name}")
+        print(f"📦 GitHub URL: {github_url}")
+        print(DASH)
 
-        except:
-            self.show_error("Invalid input")
+        if input("\nProceed with deployment? (y/n): ").lower() == "y":
+            result = self.deploy_worker(account, worker_name, github_url)
+            if result["success"]:
+                self.display_result(result["data"])
             self.wait_enter()
 
     def bulk_deploy(self):
         """Bulk deployment"""
         self.show_header("BULK DEPLOYMENT", "Deploy Multiple Workers")
 
+        if httpx is None:
+            self.show_error("'httpx' library not installed")
+            self.show_info('Install it with: pip install "httpx[http2]"')
+            self.wait_enter()
+            return
+
         if not self.accounts:
             self.show_warning("No accounts found. Please add accounts first.")
             self.wait_enter()
@@ -579,12 +966,12 @@ class CFWorkerCLI:
         self.show_header("BULK DEPLOYMENT CONFIRMATION", "Review Bulk Deployment")
 
         print("📊 BULK DEPLOYMENT SUMMARY")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
         print(f"🔧 Workers: {', '.join(worker_names)}")
         print(f"👥 Accounts: {len(self.accounts)} accounts")
         print(f"📦 GitHub URL: {github_url}")
         print(f"📊 Total deployments: {len(worker_names) * len(self.accounts)}")
-        print("─────────────────────────────────────────────────────")
+        print(DASH)
 
         if input("\nProceed with bulk deployment? (y/n): ").lower() != "y":
             self.show_info("Cancelled")
@@ -592,43 +979,30 @@ class CFWorkerCLI:
             return
 
         # Eksekusi bulk deployment
-        results = []
-        successful = 0
-        failed = 0
-
         self.show_header("BULK DEPLOYMENT IN PROGRESS", "Deploying Workers...")
 
         total_deployments = len(worker_names) * len(self.accounts)
-        current = 0
-
-        for account in self.accounts:
-            for worker_name in worker_names:
-                current += 1
-                print(
-                    f"\n🔄 [{current}/{total_deployments}] Deploying {worker_name} to {account['email']}"
-                )
-
-                result = self.deploy_worker(account, worker_name, github_url)
-                result["account"] = account["email"]
-                result["worker"] = worker_name
-                results.append(result)
-
-                if result["success"]:
-                    successful += 1
-                    print("✅ Success")
-                else:
-                    failed += 1
-                    print("❌ Failed")
+        results = None
+        if self.supports_batch_deploy():
+            try:
+                results = self._batch_deploy(worker_names, github_url)
+            except Exception as e:
+                self.show_warning(f"Batch deployment failed: {str(e)}")
+                self.show_info("Falling back to individual deployments")
+        if results is None:
+            results = asyncio.run(self._bulk_deploy_async(worker_names, github_url))
+        successful = sum(1 for result in results if result["success"])
+        failed = total_deployments - successful
 
         # Tampilkan summary
         self.show_header("BULK DEPLOYMENT COMPLETE", "Deployment Summary")
 
         print("📊 BULK DEPLOYMENT SUMMARY")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(SEP)
         self.print_colored(f"✅ Successful: {successful}", "92")
         self.print_colored(f"❌ Failed: {failed}", "91")
         self.print_colored(f"📊 Total: {total_deployments}", "94")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(SEP)
 
         # Tampilkan successful deployments
         if successful > 0:
@@ -653,7 +1027,7 @@ class CFWorkerCLI:
         self.show_header("SYSTEM STATUS", "Current Configuration Overview")
 
         print("📊 SYSTEM STATUS")
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(SEP)
         print(f"📁 Accounts File: {ACCOUNTS_FILE}")
         print(f"📁 GitHub URLs File: {GITHUB_URLS_FILE}")
         print(f"🔗 Default GitHub URL: {self.get_default_github_url()}")
@@ -673,13 +1047,14 @@ class CFWorkerCLI:
                 )
                 print(f"  • {item['name']}{default_indicator}")
 
-        print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(SEP)
 
         self.wait_enter()
 
     def main_menu(self):
         """Menu utama"""
         while True:
+            self.refresh_config()
             self.show_header()
 
             print("Please select an option:")
@@ -692,30 +1067,19 @@ class CFWorkerCLI:
             print()
 
             try:
-                choice = int(input("Select action (1-6): "))
-
-                if choice == 1:
-                    self.single_deploy()
-                elif choice == 2:
-                    self.bulk_deploy()
-                elif choice == 3:
-                    self.manage_accounts_menu()
-                elif choice == 4:
-                    self.manage_github_urls_menu()
-                elif choice == 5:
-                    self.show_status()
-                elif choice == 6:
+                choice = self._read_int("Select action (1-6): ", 1, 6)
+                if choice == 6:
                     self.show_header("GOODBYE", "Thank you for using CF Worker CLI")
                     self.print_colored("👋 Thank you for using CF Worker CLI!", "92")
-                    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+                    print(SEP)
                     break
+
+                action = self._main_actions.get(choice)
+                if action:
+                    action()
                 else:
-                    self.show_error("Please select option 1-6")
-                    self.wait_enter()
+                    self._invalid_choice("Please select option 1-6")
 
-            except ValueError:
-                self.show_error("Please enter a number")
-                self.wait_enter()
             except KeyboardInterrupt:
                 self.show_header()
                 self.show_info("Program interrupted by user")
@@ -733,6 +1097,7 @@ def main():
             print("💡 Please install it with: pip install requests")
             sys.exit(1)
 
+        enable_windows_ansi()
         cli = CFWorkerCLI()
         cli.main_menu()
     except Exception as e: